@@ -2,24 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import importlib.util
 import json
 import time
 import os
+import pickle
+import queue
 import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from email.message import EmailMessage
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+from urllib.parse import urljoin
 
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.common.exceptions import (
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+try:
+    import orjson
+except ImportError:  # the stdlib encoder is a slower but equivalent fallback
+    orjson = None
+
+if TYPE_CHECKING:
+    from pybloom_live import ScalableBloomFilter
+
 LISTING_URL_TEMPLATE = "https://www.solar-guitars.com/shop/page/{page}/"
 PAGE_RANGE = range(1, 11)
 STATIC_LISTING_URLS = [
@@ -27,9 +45,65 @@ STATIC_LISTING_URLS = [
     "https://www.solar-guitars.com/outlet-store/",
     "https://www.solar-guitars.com/categorie-produit/accessories/",
 ]
-RESULTS_PATH = Path("results.json")
-
-@dataclass
+RESULTS_PATH = Path("results.jsonl")
+BLOOM_PATH = Path("links.bloom")
+CHROMEDRIVER_PATH_CACHE = Path(".chromedriver_path")
+CHROMEDRIVER_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_POOL_SIZE = 4
+STATIC_FETCH_CONCURRENCY = 8
+# Product imagery and web fonts are never read, so skip downloading them.
+# Stylesheets stay enabled: the sold-out badge is rendered through CSS ::before.
+BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+BLOCKED_URL_PATTERNS = ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf"]
+_PRICE_NOISE = str.maketrans("", "", "€$,")
+LISTINGS_SELECTOR = "ul.listing-products"
+ITEM_SELECTOR = f"{LISTINGS_SELECTOR} li.listing-product"
+HIDDEN_PRICE_SELECTOR = ".price_for_filter"
+VISIBLE_PRICE_SELECTOR = ".wcpbc-price"
+LINK_SELECTOR = "a.totallink"
+TITLE_SELECTOR = ".item-compare-title"
+_LISTING = (By.CSS_SELECTOR, LISTINGS_SELECTOR)
+_SELECTORS = {
+    "items": ITEM_SELECTOR,
+    "hidden": HIDDEN_PRICE_SELECTOR,
+    "visible": VISIBLE_PRICE_SELECTOR,
+    "link": LINK_SELECTOR,
+    "title": TITLE_SELECTOR,
+}
+JS_SCROLL_STATE = (
+    "return [document.body.scrollHeight, "
+    "document.querySelectorAll('%(items)s').length];"
+) % _SELECTORS
+# Reads every zero-priced tile in one WebDriver round-trip; the price filter runs in-browser
+# so only candidate tiles cross the wire. Mirrors _read_price_value.
+JS_EXTRACT_LISTINGS = """
+const priceOf = li => {
+  const h = li.querySelector('%(hidden)s');
+  const hidden = h && h.textContent.trim();
+  if (hidden) return parseFloat(hidden.replace(/[€$,]/g, ''));
+  const v = li.querySelector('%(visible)s');
+  const parts = v ? v.innerText.replace(/[€$,]/g, '').trim().split(/\\s+/) : [];
+  return parts.length && parts[0] ? parseFloat(parts[parts.length - 1]) : NaN;
+};
+return [...document.querySelectorAll('%(items)s')]
+  .filter(li => priceOf(li) === 0)
+  .map(li => {
+    const v = li.querySelector('%(visible)s');
+    const a = li.querySelector('%(link)s');
+    const t = li.querySelector('%(title)s');
+    return {
+      visible: v && v.innerText.trim(),
+      href: a && a.href,
+      title: t && t.innerText.trim(),
+      badge: window.getComputedStyle(li, '::before').getPropertyValue('content'),
+    };
+  });
+""" % _SELECTORS
+
+@dataclass(slots=True, frozen=True)
 class Listing:
     title: str
     price_text: str
@@ -39,33 +113,86 @@ class Listing:
         return {"title": self.title, "price": self.price_text, "link": self.link}
 
 
-def load_existing_results() -> Tuple[List[dict], Set[str]]:
-    """Return stored entries (allowing historical duplicates) and a set of known links."""
-    if not RESULTS_PATH.exists():
-        return [], set()
-    try:
-        data = json.loads(RESULTS_PATH.read_text())
-        if not isinstance(data, list):
-            raise ValueError("Results file must contain a list.")
-    except (OSError, json.JSONDecodeError, ValueError) as exc:
-        print(f"Failed to read {RESULTS_PATH}: {exc}. Rebuilding file.")
-        return [], set()
-    cleaned: List[dict] = []
-    links: Set[str] = set()
-    for entry in data:
-        if not isinstance(entry, dict):
-            continue
-        link = entry.get("link")
-        if not isinstance(link, str) or not link:
-            continue
-        links.add(link)
-        cleaned.append(entry)
-    return cleaned, links
+def _dump_line(entry: dict) -> bytes:
+    """Encode one archive entry as a newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + "\n").encode()
 
 
-def save_results(entries: List[dict]) -> None:
-    """Persist entries to disk."""
-    RESULTS_PATH.write_text(json.dumps(entries, indent=2))
+def _load_line(line: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def load_known_links() -> Set[str]:
+    """Stream the results archive and return the set of links it contains."""
+    links: Set[str] = set()
+    if not RESULTS_PATH.exists():
+        return links
+    try:
+        with RESULTS_PATH.open("rb") as results_file:
+            for line_number, line in enumerate(results_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = _load_line(line)
+                except ValueError as exc:  # JSONDecodeError, or UnicodeDecodeError from stdlib json
+                    print(f"Skipping malformed line {line_number} in {RESULTS_PATH}: {exc}")
+                    continue
+                if not isinstance(entry, dict):
+                    continue
+                link = entry.get("link")
+                if isinstance(link, str) and link:
+                    links.add(link)
+    except OSError as exc:
+        print(f"Failed to read {RESULTS_PATH}: {exc}")
+        return set()
+    return links
+
+
+def save_new_entries(new_entries: List[dict]) -> None:
+    """Append entries to the JSON Lines archive."""
+    with RESULTS_PATH.open("ab") as results_file:
+        for entry in new_entries:
+            results_file.write(_dump_line(entry))
+
+
+def load_seen_links() -> Set[str] | ScalableBloomFilter:
+    """Return a membership filter holding every link already stored."""
+    try:
+        from pybloom_live import ScalableBloomFilter
+    except ImportError:
+        print("pybloom-live not installed; reading known links from the results archive.")
+        return load_known_links()
+    if BLOOM_PATH.exists():
+        try:
+            with BLOOM_PATH.open("rb") as bloom_file:
+                return pickle.load(bloom_file)
+        except (
+            OSError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            ValueError,
+            pickle.UnpicklingError,
+        ) as exc:
+            print(f"Failed to read {BLOOM_PATH}: {exc}. Rebuilding filter.")
+    bloom = ScalableBloomFilter(initial_capacity=10_000, error_rate=0.001)
+    for link in load_known_links():
+        bloom.add(link)
+    return bloom
+
+
+def save_seen_links(seen: Set[str] | ScalableBloomFilter) -> None:
+    """Persist the bloom filter, or drop a stale one when the set fallback was used."""
+    if isinstance(seen, set):
+        # The archive gained links the pickled filter lacks; rebuild it from the archive next time.
+        BLOOM_PATH.unlink(missing_ok=True)
+        return
+    with BLOOM_PATH.open("wb") as bloom_file:
+        pickle.dump(seen, bloom_file)
 
 
 def _bool_from_env(name: str, default: bool = True) -> bool:
@@ -96,12 +223,57 @@ def get_email_settings() -> Tuple[str, int, str, str, str, str, bool] | None:
     return host, port, user, password, sender, recipient, use_tls
 
 
-def send_email_notification(listings: List[dict]) -> None:
-    """Send a summary email for any new listings."""
+_smtp: smtplib.SMTP | None = None
+
+
+def _get_smtp(settings: Tuple[str, int, str, str, str, str, bool]) -> smtplib.SMTP:
+    """Return a logged-in SMTP session, reconnecting when the cached one went stale."""
+    global _smtp
+    host, port, user, password, _sender, _recipient, use_tls = settings
+    if _smtp is not None:
+        try:
+            _smtp.noop()
+            return _smtp
+        except (smtplib.SMTPException, OSError):
+            _smtp.close()
+            _smtp = None
+    server = smtplib.SMTP(host, port, timeout=30)
+    try:
+        server.ehlo()
+        if use_tls:
+            server.starttls()
+            server.ehlo()
+        server.login(user, password)
+    except Exception:
+        server.close()
+        raise
+    _smtp = server
+    return server
+
+
+def _close_smtp() -> None:
+    global _smtp
+    if _smtp is None:
+        return
+    try:
+        _smtp.quit()
+    except (smtplib.SMTPException, OSError):
+        _smtp.close()
+    _smtp = None
+
+
+atexit.register(_close_smtp)
+
+
+def send_email_notification(listings: List[dict]) -> bool:
+    """Send a summary email for any new listings.
+
+    Returns False only when a configured notification failed to send.
+    """
     settings = get_email_settings()
     if not settings or not listings:
-        return
-    host, port, user, password, sender, recipient, use_tls = settings
+        return True
+    sender, recipient = settings[4], settings[5]
     lines = [
         f"Found {len(listings)} new zero-price listing(s):",
         "",
@@ -118,14 +290,56 @@ def send_email_notification(listings: List[dict]) -> None:
     msg.set_content(body)
 
     try:
-        with smtplib.SMTP(host, port, timeout=30) as server:
-            if use_tls:
-                server.starttls()
-            server.login(user, password)
-            server.send_message(msg)
+        _get_smtp(settings).send_message(msg)
         print(f"Notification email sent to {recipient}.")
     except Exception as exc:
         print(f"Failed to send notification email: {exc}")
+        return False
+    return True
+
+
+def _installed_chrome_major() -> str | None:
+    """Return the installed Chrome major version, or None when it can't be detected."""
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+    return version.split(".")[0] if version else None
+
+
+def resolve_chromedriver_path() -> tuple[str, bool]:
+    """Return a chromedriver binary and whether it came from the sidecar cache.
+
+    A cached path is reused for up to a week, as long as it was resolved for the
+    Chrome major version that is installed now.
+    """
+    chrome_major = _installed_chrome_major()
+    try:
+        cached_path, _, cached_major = CHROMEDRIVER_PATH_CACHE.read_text().strip().partition("\n")
+        cached = Path(cached_path)
+        if (
+            cached.is_file()
+            and time.time() - cached.stat().st_mtime < CHROMEDRIVER_CACHE_TTL
+            and (chrome_major is None or cached_major.strip() == chrome_major)
+        ):
+            return str(cached), True
+    except OSError:
+        pass
+    os.environ.setdefault("WDM_LOCAL", "1")
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError as exc:
+        raise RuntimeError(
+            "webdriver-manager is required; install it via 'pip install webdriver-manager'."
+        ) from exc
+    driver_path = ChromeDriverManager().install()
+    try:
+        CHROMEDRIVER_PATH_CACHE.write_text(f"{driver_path}\n{chrome_major or ''}")
+    except OSError as exc:
+        print(f"Failed to cache chromedriver path in {CHROMEDRIVER_PATH_CACHE}: {exc}")
+    return driver_path, False
 
 
 def build_driver(headless: bool = True) -> webdriver.Chrome:
@@ -136,96 +350,156 @@ def build_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1440,900")
     chrome_options.add_argument("--no-sandbox")
+    # Listings are complete at DOMContentLoaded; don't block on beacons and other subresources.
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
+    driver_path, from_cache = resolve_chromedriver_path()
     try:
-        from webdriver_manager.chrome import ChromeDriverManager
-    except ImportError as exc:
-        raise RuntimeError(
-            "webdriver-manager is required; install it via 'pip install webdriver-manager'."
-        ) from exc
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(options=chrome_options, service=service)
+        driver = webdriver.Chrome(options=chrome_options, service=Service(driver_path))
+    except SessionNotCreatedException:
+        if not from_cache:
+            raise
+        # Chrome updated since the path was cached; drop the sidecar and resolve a fresh driver.
+        print(f"Cached chromedriver {driver_path} does not match Chrome; reinstalling.")
+        CHROMEDRIVER_PATH_CACHE.unlink(missing_ok=True)
+        driver_path, _ = resolve_chromedriver_path()
+        driver = webdriver.Chrome(options=chrome_options, service=Service(driver_path))
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except WebDriverException as exc:
+        print(f"Could not block static assets via CDP: {exc.msg}")
     driver.set_page_load_timeout(60)
     return driver
 
 
+class DriverPool:
+    """Fixed set of pre-warmed Chrome drivers shared between worker threads."""
+
+    def __init__(self, size: int, headless: bool = True) -> None:
+        self._drivers: List[webdriver.Chrome] = []
+        self._idle: queue.Queue[webdriver.Chrome] = queue.Queue()
+        try:
+            for _ in range(size):
+                driver = build_driver(headless=headless)
+                self._drivers.append(driver)
+                self._idle.put(driver)
+        except Exception:
+            self.close()
+            raise
+
+    def acquire(self) -> webdriver.Chrome:
+        """Block until an idle driver is available and hand it out."""
+        return self._idle.get()
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """Return a driver to the idle queue."""
+        self._idle.put(driver)
+
+    def close(self) -> None:
+        """Quit every driver owned by the pool."""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except WebDriverException as exc:
+                print(f"Failed to quit driver: {exc.msg}")
+        self._drivers.clear()
+
+
+def get_pool_size() -> int:
+    """Read the number of concurrent browsers from CRAWLER_POOL_SIZE."""
+    raw = os.getenv("CRAWLER_POOL_SIZE")
+    if raw is None:
+        return DEFAULT_POOL_SIZE
+    try:
+        size = int(raw)
+    except ValueError:
+        print(f"Invalid CRAWLER_POOL_SIZE={raw!r}; using {DEFAULT_POOL_SIZE}.")
+        return DEFAULT_POOL_SIZE
+    return max(1, size)
+
+
 def wait_for_listings(driver: webdriver.Chrome, timeout: int = 30) -> None:
     """Block until the listings container appears."""
     WebDriverWait(driver, timeout).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "ul.listing-products"))
+        EC.presence_of_element_located(_LISTING)
     )
 
 
-def scroll_page(driver: webdriver.Chrome, pause: float = 0.75) -> None:
-    """Scroll down gradually so lazy-loaded tiles appear."""
-    prev_height = driver.execute_script("return document.body.scrollHeight")
-    while True:
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(pause)
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == prev_height:
-            break
-        prev_height = new_height
+def _scroll_state(driver: webdriver.Chrome) -> list:
+    """Return the current page height and tile count in one round-trip."""
+    return driver.execute_script(JS_SCROLL_STATE)
 
 
-def _read_price_value(element: WebElement) -> tuple[str | None, float | None]:
-    """Extract text representation and numeric value of the price, if any."""
-    price_text: str | None = None
-    price_value: float | None = None
-    try:
-        hidden = element.find_element(By.CSS_SELECTOR, ".price_for_filter")
-        hidden_text = hidden.get_attribute("textContent").strip()
-        if hidden_text:
-            price_value = float(hidden_text.replace(",", ""))
-    except NoSuchElementException:
-        pass
+def scroll_page(driver: webdriver.Chrome, settle: float = 0.25) -> None:
+    """Scroll down until lazy-loaded tiles stop appearing.
 
-    try:
-        visible = element.find_element(By.CSS_SELECTOR, ".wcpbc-price")
-        price_text = visible.text.strip()
-        if price_value is None and price_text:
-            numeric = (
-                price_text.replace("€", "")
-                .replace("$", "")
-                .replace(",", "")
-                .split()  # there might be both original and sale prices
+    After each scroll the DOM is polled until the height or tile count grows. The quiet
+    window doubles after a poll without growth, and two quiet polls in a row end the loop.
+    """
+    prev_state = _scroll_state(driver)
+    wait = settle
+    quiet_polls = 0
+    while quiet_polls < 2:
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, wait, poll_frequency=0.05).until(
+                lambda d: _scroll_state(d) != prev_state
             )
-            if numeric:
-                price_value = float(numeric[-1])
-    except NoSuchElementException:
-        pass
+        except TimeoutException:
+            quiet_polls += 1
+            wait *= 2
+            continue
+        prev_state = _scroll_state(driver)
+        wait = settle
+        quiet_polls = 0
+
+
+def _read_price_value(
+    hidden_text: str | None, visible_text: str | None
+) -> tuple[str | None, float | None]:
+    """Extract text representation and numeric value of the price, if any.
+
+    Clearly nonzero hidden prices short-circuit to a 1.0 sentinel without a float parse,
+    since callers only distinguish zero from nonzero.
+    """
+    price_text: str | None = visible_text or None
+    price_value: float | None = None
+    if hidden_text:
+        cleaned = hidden_text.translate(_PRICE_NOISE)
+        if cleaned.strip("0."):
+            return price_text, 1.0
+        price_value = float(cleaned)
+
+    if price_value is None and price_text:
+        # there might be both original and sale prices
+        numeric = price_text.translate(_PRICE_NOISE).split()
+        if numeric:
+            price_value = float(numeric[-1])
 
     return price_text, price_value
 
 
-def _has_sold_out_badge(element: WebElement) -> bool:
-    """Return True when the ::before pseudo-element renders a 'Sold out' banner."""
-    try:
-        content: str | None = element.parent.execute_script(
-            "return window.getComputedStyle(arguments[0], '::before').getPropertyValue('content');",
-            element,
-        )
-    except WebDriverException:
+def _has_sold_out_badge(badge: str | None) -> bool:
+    """Return True when the ::before pseudo-element content reads 'Sold out'."""
+    if not badge:
         return False
-    if not content:
-        return False
-    normalized = content.strip().strip("'").strip('"').lower()
+    normalized = badge.strip().strip("'").strip('"').lower()
     return "sold out" in normalized
 
 
-def extract_listing_info(element: WebElement) -> Listing | None:
-    """Return listing details if the price is zero, else None."""
-    price_text, price_value = _read_price_value(element)
-    if price_value is None or price_value != 0.0:
+def extract_listing_info(tile: dict) -> Listing | None:
+    """Return listing details for a zero-priced tile, or None when it is sold out."""
+    if _has_sold_out_badge(tile.get("badge")):
         return None
-    if _has_sold_out_badge(element):
+    link = tile.get("href")
+    if not link:
         return None
-
-    link_element = element.find_element(By.CSS_SELECTOR, "a.totallink")
-    title_element = element.find_element(By.CSS_SELECTOR, ".item-compare-title")
     return Listing(
-        title=title_element.text.strip(),
-        price_text=price_text or "€0.00",
-        link=link_element.get_attribute("href"),
+        title=(tile.get("title") or "").strip(),
+        price_text=tile.get("visible") or "€0.00",
+        link=link,
     )
 
 
@@ -234,6 +508,9 @@ def collect_free_listings_on_url(driver: webdriver.Chrome, url: str, retries: in
     attempt = 0
     while attempt <= retries:
         try:
+            # Drop the previous page's timers and pending requests before navigating.
+            driver.execute_script("window.stop();")
+            driver.get("about:blank")
             driver.get(url)
             wait_for_listings(driver)
             break
@@ -244,59 +521,255 @@ def collect_free_listings_on_url(driver: webdriver.Chrome, url: str, retries: in
             if attempt > retries:
                 print(f"Giving up on {url} after repeated timeouts.")
                 return []
-            time.sleep(2)
+            delay = 2 ** attempt
+            print(f"Retrying {url} in {delay}s.")
+            time.sleep(delay)
         except WebDriverException as exc:
             print(f"Failed to load {url}: {exc.msg}")
             return []
     scroll_page(driver)
-    items = driver.find_elements(By.CSS_SELECTOR, "ul.listing-products li.listing-product")
+    tiles = driver.execute_script(JS_EXTRACT_LISTINGS) or []
     free_entries: List[Listing] = []
-    for item in items:
-        listing = extract_listing_info(item)
+    for tile in tiles:
+        listing = extract_listing_info(tile)
         if listing:
             free_entries.append(listing)
     return free_entries
 
 
-def collect_free_listings_on_page(driver: webdriver.Chrome, page_number: int) -> List[Listing]:
-    """Wrapper to handle paginated /shop URLs."""
-    return collect_free_listings_on_url(
-        driver, LISTING_URL_TEMPLATE.format(page=page_number)
-    )
+def _parse_static_listings(html: str, url: str) -> List[Listing] | None:
+    """Parse zero-priced listings from server-rendered markup.
 
+    Returns None when no tiles exist or a price can't be parsed, so the url goes to the browser.
+    """
+    from selectolax.parser import HTMLParser
 
-def main() -> None:
-    driver = build_driver(headless=True)
+    tiles = HTMLParser(html).css(ITEM_SELECTOR)
+    if not tiles:
+        return None
+    free_entries: List[Listing] = []
+    for tile in tiles:
+        hidden = tile.css_first(HIDDEN_PRICE_SELECTOR)
+        visible = tile.css_first(VISIBLE_PRICE_SELECTOR)
+        link = tile.css_first(LINK_SELECTOR)
+        title = tile.css_first(TITLE_SELECTOR)
+        # Without CSS the ::before badge is unavailable; WooCommerce tags sold-out tiles instead.
+        if "outofstock" in (tile.attributes.get("class") or "").split():
+            continue
+        try:
+            price_text, price_value = _read_price_value(
+                hidden.text().strip() if hidden else None,
+                visible.text(separator=" ", strip=True) if visible else None,
+            )
+        except ValueError as exc:
+            print(f"Unparseable price on {url} ({exc}); falling back to the browser.")
+            return None
+        if price_value is None or price_value != 0.0:
+            continue
+        listing = extract_listing_info(
+            {
+                "visible": price_text,
+                "href": urljoin(url, link.attributes.get("href") or "") if link else None,
+                "title": title.text(separator=" ", strip=True) if title else None,
+            }
+        )
+        if listing:
+            free_entries.append(listing)
+    return free_entries
+
+
+async def fetch_listings(client, semaphore: asyncio.Semaphore, url: str) -> List[Listing] | None:
+    """Fetch a listing url over plain HTTP; None means the page needs a browser."""
+    import httpx
+
+    async with semaphore:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            print(f"Static fetch of {url} failed: {exc}")
+            return None
+    return _parse_static_listings(response.text, url)
+
+
+async def _fetch_all_static(urls: List[str]) -> List[List[Listing] | None]:
+    import httpx
+
+    semaphore = asyncio.Semaphore(STATIC_FETCH_CONCURRENCY)
+    async with httpx.AsyncClient(http2=True, timeout=30, follow_redirects=True) as client:
+        return await asyncio.gather(*(fetch_listings(client, semaphore, url) for url in urls))
+
+
+def collect_static_listings(urls: List[str]) -> Dict[str, List[Listing] | None]:
+    """Scan urls without a browser when httpx and selectolax are installed."""
+    if not all(importlib.util.find_spec(name) for name in ("h2", "httpx", "selectolax")):
+        print("httpx[http2] and selectolax are required for static fetching; using the browser.")
+        return {url: None for url in urls}
+    return dict(zip(urls, asyncio.run(_fetch_all_static(urls))))
+
+
+def _scan(pool: DriverPool, url: str) -> List[Listing]:
+    """Scan a single url with a driver borrowed from the pool."""
+    driver = pool.acquire()
+    try:
+        return collect_free_listings_on_url(driver, url)
+    finally:
+        pool.release(driver)
+
+
+def _as_js_function(body: str) -> str:
+    """Wrap a WebDriver-style script body so Playwright can evaluate it."""
+    return f"() => {{{body}}}"
+
+
+async def _block_static_assets(route) -> None:
+    if route.request.resource_type in {"image", "font"}:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _autoscroll(page, settle: float = 0.25) -> None:
+    """Playwright counterpart of scroll_page."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    scroll_state = _as_js_function(JS_SCROLL_STATE)
+    prev_state = await page.evaluate(scroll_state)
+    wait = settle
+    quiet_polls = 0
+    while quiet_polls < 2:
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        try:
+            await page.wait_for_function(
+                f"prev => JSON.stringify(({scroll_state})()) !== JSON.stringify(prev)",
+                arg=prev_state,
+                polling=50,
+                timeout=wait * 1000,
+            )
+        except PlaywrightTimeoutError:
+            quiet_polls += 1
+            wait *= 2
+            continue
+        prev_state = await page.evaluate(scroll_state)
+        wait = settle
+        quiet_polls = 0
+
+
+async def _scan_with_playwright(
+    browser, semaphore: asyncio.Semaphore, url: str, retries: int = 2
+) -> List[Listing]:
+    """Scan a single url in its own browser context."""
+    from playwright.async_api import Error as PlaywrightError
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    async with semaphore:
+        context = await browser.new_context(viewport={"width": 1440, "height": 900})
+        try:
+            await context.route("**/*", _block_static_assets)
+            page = await context.new_page()
+            attempt = 0
+            while attempt <= retries:
+                try:
+                    await page.goto(url, wait_until="domcontentloaded", timeout=60_000)
+                    await page.locator(LISTINGS_SELECTOR).first.wait_for(state="attached", timeout=30_000)
+                    break
+                except PlaywrightTimeoutError:
+                    attempt += 1
+                    print(f"Timed out loading {url}, attempt {attempt}/{retries + 1}.")
+                    if attempt > retries:
+                        print(f"Giving up on {url} after repeated timeouts.")
+                        return []
+                    delay = 2 ** attempt
+                    print(f"Retrying {url} in {delay}s.")
+                    await asyncio.sleep(delay)
+                except PlaywrightError as exc:
+                    print(f"Failed to load {url}: {exc.message}")
+                    return []
+            await _autoscroll(page)
+            tiles = await page.evaluate(_as_js_function(JS_EXTRACT_LISTINGS)) or []
+        finally:
+            await context.close()
+    free_entries: List[Listing] = []
+    for tile in tiles:
+        listing = extract_listing_info(tile)
+        if listing:
+            free_entries.append(listing)
+    return free_entries
+
+
+async def _scan_all_with_playwright(urls: List[str]) -> List[List[Listing]]:
+    from playwright.async_api import async_playwright
+
+    semaphore = asyncio.Semaphore(get_pool_size())
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True, args=["--disable-gpu"])
+        try:
+            return await asyncio.gather(
+                *(_scan_with_playwright(browser, semaphore, url) for url in urls)
+            )
+        finally:
+            await browser.close()
+
+
+def scan_with_playwright(urls: List[str]) -> Dict[str, List[Listing]]:
+    """Scan urls concurrently, one cheap browser context per url in a single Chromium."""
+    if importlib.util.find_spec("playwright") is None:
+        raise RuntimeError(
+            "playwright is required for CRAWLER_BROWSER=playwright; install it via "
+            "'pip install playwright && playwright install chromium'."
+        )
+    return dict(zip(urls, asyncio.run(_scan_all_with_playwright(urls))))
+
+
+def scan_with_browsers(urls: List[str]) -> Dict[str, List[Listing]]:
+    """Scan urls concurrently using a pool of Chrome drivers."""
+    pool_size = min(get_pool_size(), len(urls))
+    pool = DriverPool(pool_size, headless=True)
     try:
-        run_listings: List[Listing] = []
-        for page in PAGE_RANGE:
-            page_listings = collect_free_listings_on_page(driver, page)
-            run_listings.extend(page_listings)
-            print(f"Page {page} scanned, zero-price items found: {len(page_listings)}")
-        for url in STATIC_LISTING_URLS:
-            url_listings = collect_free_listings_on_url(driver, url)
-            run_listings.extend(url_listings)
-            print(f"{url} scanned, zero-price items found: {len(url_listings)}")
-
-        stored_entries, _known_links = load_existing_results()
-        new_entries: List[dict] = []
-        run_seen: Set[str] = set()
-        for listing in run_listings:
-            if listing.link in run_seen:
-                continue
-            run_seen.add(listing.link)
-            entry = listing.to_dict()
-            stored_entries.append(entry)
-            new_entries.append(entry)
-
-        save_results(stored_entries)
-        print(json.dumps(new_entries, indent=2))
-        if new_entries:
-            send_email_notification(new_entries)
-        else:
-            print("No new zero-price listings discovered this run.")
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            return dict(zip(urls, executor.map(lambda url: _scan(pool, url), urls)))
     finally:
-        driver.quit()
+        pool.close()
+
+
+def main() -> None:
+    urls = [LISTING_URL_TEMPLATE.format(page=page) for page in PAGE_RANGE] + STATIC_LISTING_URLS
+    scanned: Dict[str, List[Listing]] = {}
+    if _bool_from_env("CRAWLER_STATIC_FETCH", False):
+        for url, url_listings in collect_static_listings(urls).items():
+            if url_listings is None:
+                print(f"No listings parsed from static HTML of {url}; falling back to the browser.")
+            else:
+                scanned[url] = url_listings
+    pending = [url for url in urls if url not in scanned]
+    if pending and os.getenv("CRAWLER_BROWSER", "chrome").strip().lower() == "playwright":
+        scanned.update(scan_with_playwright(pending))
+    elif pending:
+        scanned.update(scan_with_browsers(pending))
+
+    run_listings: List[Listing] = []
+    for url in urls:
+        url_listings = scanned[url]
+        run_listings.extend(url_listings)
+        print(f"{url} scanned, zero-price items found: {len(url_listings)}")
+
+    seen = load_seen_links()
+    new_entries: List[dict] = []
+    for listing in run_listings:
+        if listing.link in seen:
+            continue
+        seen.add(listing.link)
+        new_entries.append(listing.to_dict())
+
+    print(json.dumps(new_entries, indent=2))
+    if not new_entries:
+        print("No new zero-price listings discovered this run.")
+    elif send_email_notification(new_entries):
+        save_new_entries(new_entries)
+        save_seen_links(seen)
+    else:
+        # Leave them unrecorded so the next run notifies again.
+        print("Notification failed; new listings were not recorded and will be retried.")
 
 
 if __name__ == "__main__":